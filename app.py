@@ -1,5 +1,5 @@
 import streamlit as st
-import json
+import orjson
 import os
 
 # ---------------------------------------------------
@@ -16,24 +16,51 @@ PATH_AI_RESULTS = f"{BASE}/ai_results.json"
 PATH_NOTIFICATIONS = f"{BASE}/notifications.json"
 PATH_ORDERS = f"{BASE}/doctor_orders.json"
 
+# Per-patient dashboard fields the UI never shows. They dominate the size of
+# doctor_dashboard.json, so they are dropped before the parsed data is cached.
+DASHBOARD_UNUSED_FIELDS = ("rag_explanation",)
+
 
 # ---------------------------------------------------
 # 📌 Helper function to load JSON safely
 # ---------------------------------------------------
-def load_json(path):
-    if not os.path.exists(path):
+# Streamlit re-runs this whole script on every widget interaction, so the
+# parsed files are cached. The file's (mtime_ns, size) is part of the cache
+# key: an unchanged file is not re-read or re-parsed (st.cache_data still
+# hands back a fresh unpickled copy on each hit), a rewritten one is read
+# again. max_entries bounds the stale copies left behind by rewrites.
+@st.cache_data(show_spinner=False, max_entries=32)
+def _load_json_cached(path, mtime_ns, size, drop_fields=()):
+    with open(path, "rb") as f:
+        data = orjson.loads(f.read())
+    if drop_fields and isinstance(data, dict):
+        for entry in data.values():
+            if isinstance(entry, dict):
+                for field in drop_fields:
+                    entry.pop(field, None)
+    return data
+
+
+def load_json(path, drop_fields=()):
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
         return {}
     try:
-        with open(path, "r") as f:
-            return json.load(f)
-    except:
+        return _load_json_cached(path, stat.st_mtime_ns, stat.st_size, drop_fields)
+    except orjson.JSONDecodeError as e:
+        st.error(f"Could not parse {path}: {e}")
         return {}
 
 
+# Must be the first Streamlit command: load_json may report parse errors.
+st.set_page_config(page_title="AI Doctor Dashboard", layout="wide")
+
+
 # ---------------------------------------------------
 # 📌 Load all data
 # ---------------------------------------------------
-dashboard = load_json(PATH_DASHBOARD)
+dashboard = load_json(PATH_DASHBOARD, drop_fields=DASHBOARD_UNUSED_FIELDS)
 doctors = load_json(PATH_DOCTORS)
 patients = load_json(PATH_PATIENTS)
 appointments = load_json(PATH_APPOINTMENTS)
@@ -45,8 +72,6 @@ doctor_orders = load_json(PATH_ORDERS)
 # ---------------------------------------------------
 # 🌟 Streamlit UI Begins
 # ---------------------------------------------------
-st.set_page_config(page_title="AI Doctor Dashboard", layout="wide")
-
 st.title("🩺 AI-Powered Doctor Dashboard")
 
 # ---------------------------------------------------